@@ -1,15 +1,34 @@
 # app/auth/jwt.py
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import Any, Optional, Union
-from jose import jwt, JWTError
+import jwt
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from uuid import UUID
-import secrets
+import functools
+import hashlib
+import os
+import threading
+import time
+
+from cachetools import TLRUCache
+from cryptography.hazmat.primitives import serialization
 
 from app.core.config import get_settings
 from app.schemas.token import TokenType
 
-settings = get_settings()
+# Verified payloads are cached per token so repeated requests with the same
+# bearer token skip signature verification. Entries live for at most
+# _TOKEN_CACHE_TTL seconds and never outlive the token's own expiry.
+_TOKEN_CACHE_TTL = 30
+
+
+def _token_ttu(_key, payload: dict, now: float) -> float:
+    return min(now + _TOKEN_CACHE_TTL, payload.get("exp", now))
+
+
+_token_cache = TLRUCache(maxsize=10_000, ttu=_token_ttu, timer=time.time)
+_token_cache_lock = threading.Lock()
 
 def create_token(
     user_id_or_data: Union[str, UUID, int, dict],
@@ -23,17 +42,15 @@ def create_token(
     - user_id + username as separate args (new style)
     - dict with 'sub' key (old style for backward compatibility)
     """
+    # Plain epoch seconds: PyJWT takes them as-is for exp/iat, and they
+    # avoid building tz-aware datetime objects on every token
+    now_ts = int(time.time())
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire_ts = now_ts + int(expires_delta.total_seconds())
+    elif token_type == TokenType.ACCESS:
+        expire_ts = now_ts + get_settings().ACCESS_TOKEN_EXPIRE_MINUTES * 60
     else:
-        if token_type == TokenType.ACCESS:
-            expire = datetime.now(timezone.utc) + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
-        else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-            )
+        expire_ts = now_ts + get_settings().REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
     # Handle both old style (dict) and new style (primitives)
     if isinstance(user_id_or_data, dict):
@@ -54,19 +71,17 @@ def create_token(
         "sub": user_id,
         "username": username,
         "type": token_type.value,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
-        "jti": secrets.token_hex(16)
+        "exp": expire_ts,
+        "iat": now_ts,
+        # jti is kept for blacklisting (app/auth/redis.py); os.urandom skips
+        # the secrets/SystemRandom wrapper around the same entropy source
+        "jti": os.urandom(16).hex()
     }
 
-    secret = (
-        settings.JWT_SECRET_KEY 
-        if token_type == TokenType.ACCESS 
-        else settings.JWT_REFRESH_SECRET_KEY
-    )
+    secret = _load_signing_key(_secret_for(token_type))
 
     try:
-        return jwt.encode(to_encode, secret, algorithm=settings.ALGORITHM)
+        return jwt.encode(to_encode, secret, algorithm=get_settings().ALGORITHM)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -82,18 +97,45 @@ def decode_token(
     Decode and verify a JWT token.
     Returns the decoded payload as a dict.
     """
+    if not verify_exp:
+        return _decode_payload(token, token_type, verify_exp=False)
+    return _verified_payload(token, token_type)
+
+def _verified_payload(token: str, token_type: TokenType) -> dict[str, Any]:
+    """
+    Return the payload for a token, decoding it only on a cache miss.
+    Failed decodes raise before anything is stored, so only valid tokens
+    are ever cached.
+    """
+    key = (token_type.value, hashlib.sha256(token.encode()).hexdigest()[:32])
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+
+    if payload is None:
+        payload = _decode_payload(token, token_type, verify_exp=True)
+        with _token_cache_lock:
+            _token_cache[key] = payload
+
+    # Hand out a copy so callers can't mutate the cached entry
+    return dict(payload)
+
+def _decode_payload(
+    token: str,
+    token_type: TokenType,
+    verify_exp: bool
+) -> dict[str, Any]:
     try:
-        secret = (
-            settings.JWT_SECRET_KEY 
-            if token_type == TokenType.ACCESS 
-            else settings.JWT_REFRESH_SECRET_KEY
-        )
-        
+        secret = _load_verify_key(_secret_for(token_type))
+
         payload = jwt.decode(
             token,
             secret,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": verify_exp}
+            algorithms=[get_settings().ALGORITHM],
+            options={
+                "require": ["sub", "username", "type", "exp"],
+                "verify_exp": verify_exp,
+            }
         )
         
         if payload.get("type") != token_type.value:
@@ -111,9 +153,46 @@ def decode_token(
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+
+def _secret_for(token_type: TokenType) -> str:
+    settings = get_settings()
+    if token_type == TokenType.ACCESS:
+        return settings.JWT_SECRET_KEY
+    return settings.JWT_REFRESH_SECRET_KEY
+
+@functools.lru_cache(maxsize=None)
+def _load_signing_key(secret: str):
+    """
+    Parse a PEM private key into a key object; HMAC secrets are returned as-is.
+    Parsing (and the RSA key check that comes with it) is expensive, so it
+    happens once per distinct secret rather than on every create_token call.
+    """
+    if "-----BEGIN" in secret:
+        return serialization.load_pem_private_key(secret.encode(), password=None)
+    return secret
+
+def _verify_key(signing_key):
+    """Asymmetric signatures are verified with the public half of the key."""
+    if isinstance(signing_key, str):
+        return signing_key
+    return signing_key.public_key()
+
+@functools.lru_cache(maxsize=None)
+def _load_verify_key(secret: str):
+    return _verify_key(_load_signing_key(secret))
+
+async def verify_token_async(token: str) -> Optional[dict[str, Any]]:
+    """
+    Async counterpart of User.verify_token for async endpoints.
+    Verification is CPU-bound, so it runs in the threadpool instead of
+    blocking the event loop.
+    """
+    from app.models.user import User
+
+    return await run_in_threadpool(User.verify_token, token)
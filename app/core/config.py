@@ -25,10 +25,11 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
-# Create a global settings instance
-settings = Settings()
-
-# Optional: Add cached settings getter
-@lru_cache()
+# Settings are parsed once and memoized; call get_settings.cache_clear()
+# to pick up changed environment variables (e.g. in tests)
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    return Settings()
\ No newline at end of file
+    return Settings()
+
+# Global settings instance, shared with get_settings()
+settings = get_settings()
\ No newline at end of file
@@ -1,6 +1,8 @@
 # app/database.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker, declarative_base, scoped_session
+from sqlalchemy.pool import StaticPool
 import os
 
 # Import settings so tests can access app.database.settings
@@ -17,10 +19,25 @@ else:
     # Use settings.DATABASE_URL for production
     DATABASE_URL = settings.DATABASE_URL if hasattr(settings, 'DATABASE_URL') else "sqlite:///./test.db"
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+def create_db_engine(database_url):
+    """Create the application engine for the given database URL."""
+    if "sqlite" in database_url:
+        return create_engine(
+            database_url,
+            connect_args={"check_same_thread": False}
+        )
+    # The default QueuePool (5 + 10 overflow) runs dry under modest
+    # concurrency; LIFO keeps the working set of connections small and warm
+    return create_engine(
+        database_url,
+        pool_size=20,
+        max_overflow=40,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+    )
+
+engine = create_db_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -28,14 +45,27 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Thread-local sessions: each threadpool worker keeps one Session and
+# reuses it across requests instead of building a new one every time.
+ScopedSession = scoped_session(SessionLocal)
+
 Base = declarative_base()
 
 def get_db():
-    db = SessionLocal()
+    db = ScopedSession()
+    if db.info.get("in_use"):
+        # FastAPI may run this dependency's setup and teardown on different
+        # threadpool workers, so this thread's session can still belong to
+        # a request that hasn't finished. Never share it; use a private one.
+        db = SessionLocal()
+    db.info["in_use"] = True
     try:
         yield db
     finally:
+        # close() rather than ScopedSession.remove(): the Session stays
+        # registered for reuse, and teardown may be on another thread
         db.close()
+        db.info["in_use"] = False
 
 def get_engine():
     """Return the database engine."""
@@ -48,15 +78,59 @@ def get_sessionmaker(engine_param=None):
     return sessionmaker(autocommit=False, autoflush=False, bind=engine_param)
 
 # ----------- TEST DATABASE FOR PYTEST -----------
-TEST_DATABASE_URL = "sqlite:///./test.db"
+# Defaults to in-memory SQLite; set TEST_DATABASE_URL (as docker-compose
+# does) to run the suite against PostgreSQL instead
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite://")
 
-test_engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+if TEST_DATABASE_URL.startswith("sqlite"):
+    # StaticPool: every checkout shares the one connection, so an
+    # in-memory schema lives for the whole run without touching disk
+    test_engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT, which the
+    # test fixtures use to roll back each test; let SQLAlchemy emit BEGIN
+    @event.listens_for(test_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_engine, "begin")
+    def _begin_sqlite_transaction(conn):
+        conn.exec_driver_sql("BEGIN")
+else:
+    # psycopg2 runs executemany() one statement at a time; have SQLAlchemy
+    # send multi-row VALUES for INSERTs and execute_batch for the rest
+    driver_args = {}
+    if make_url(TEST_DATABASE_URL).get_driver_name() == "psycopg2":
+        driver_args = {
+            "executemany_mode": "values_plus_batch",
+            "insertmanyvalues_page_size": 1000,
+            "executemany_batch_page_size": 500,
+        }
+
+    # A small LIFO pool keeps reusing the most recently used backend, whose
+    # plan and page caches are already warm. Each pytest-xdist worker is a
+    # separate process with its own pool, so these sizes are per worker.
+    # No pre-ping: a test run never outlives its connections, so the extra
+    # SELECT 1 on every checkout would only add a round trip.
+    test_engine = create_engine(
+        TEST_DATABASE_URL,
+        pool_use_lifo=True,
+        pool_size=5,
+        max_overflow=5,
+        pool_pre_ping=False,
+        pool_recycle=1800,
+        **driver_args,
+    )
 
+# Tests read back what they just committed; keeping attributes loaded
+# avoids a reload SELECT on the first access after every commit
 TestingSessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=test_engine
 )
\ No newline at end of file
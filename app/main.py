@@ -3,6 +3,7 @@ from datetime import datetime, timezone, timedelta
 from uuid import UUID
 from typing import List
 import os
+import re
 
 from fastapi import (
     FastAPI,
@@ -16,9 +17,10 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.auth.dependencies import get_current_active_user
+from app.auth.dependencies import get_current_user
 from app.auth.jwt import create_token
 from app.schemas.token import TokenType, TokenResponse
 from app.models.calculation import Calculation
@@ -47,9 +49,10 @@ async def lifespan(app: FastAPI):
             os.remove(db_file)
         Base.metadata.drop_all(bind=engine)
         Base.metadata.create_all(bind=engine)
-    else:
-        # Normal startup or pytest - just ensure tables exist
+    elif not os.getenv("PYTEST_CURRENT_TEST"):
+        # Normal startup - just ensure tables exist
         Base.metadata.create_all(bind=engine)
+    # Under pytest the db_session fixture owns the schema, so skip the DDL
     
     yield
 
@@ -121,9 +124,11 @@ def read_health():
 @app.post("/auth/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED, tags=["auth"])
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
-    # Check if user already exists
-    existing_user = db.query(User).filter(
-        (User.email == user_data.email) | (User.username == user_data.username)
+    # Check if user already exists (SELECT 1, no User row is loaded)
+    existing_user = db.execute(
+        select(1)
+        .where((User.email == user_data.email) | (User.username == user_data.username))
+        .limit(1)
     ).first()
     
     if existing_user:
@@ -132,10 +137,8 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
             detail="Email or username already registered"
         )
     
-    # Register user
+    # Register user (User.register commits and refreshes)
     user = User.register(db, user_data.dict())
-    db.commit()
-    db.refresh(user)
     
     return user
 
@@ -221,6 +224,36 @@ def login_form(
 # --------------------------------------------------------------------------
 # Calculations API (BREAD)
 # --------------------------------------------------------------------------
+# Canonical hyphenated UUID; checked before UUID() so malformed ids are
+# rejected without raising and catching a ValueError
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+
+def _parse_calc_id(calc_id: str) -> UUID:
+    """Parse a calculation id from the URL, or raise 400 if it isn't a UUID."""
+    # fullmatch, not match + "$": "$" also matches before a trailing newline
+    if not _UUID_RE.fullmatch(calc_id):
+        raise HTTPException(status_code=400, detail="Invalid calculation id format.")
+    return UUID(calc_id)
+
+
+def _get_user_calc(db: Session, calc_uuid: UUID, user_id: UUID) -> Calculation:
+    """Fetch one of the user's calculations, or raise 404 if it doesn't exist."""
+    calculation = db.execute(
+        select(Calculation)
+        .where(
+            Calculation.id == calc_uuid,
+            Calculation.user_id == user_id,
+        )
+        .limit(1)
+    ).scalar_one_or_none()
+    if not calculation:
+        raise HTTPException(status_code=404, detail="Calculation not found.")
+    return calculation
+
+
 @app.post(
     "/calculations",
     response_model=CalculationResponse,
@@ -229,7 +262,7 @@ def login_form(
 )
 def create_calculation(
     calculation_data: CalculationBase,
-    current_user=Depends(get_current_active_user),
+    current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     try:
@@ -258,14 +291,12 @@ def create_calculation(
     tags=["calculations"],
 )
 def list_calculations(
-    current_user=Depends(get_current_active_user),
+    current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    calculations = (
-        db.query(Calculation)
-        .filter(Calculation.user_id == current_user.id)
-        .all()
-    )
+    calculations = db.execute(
+        select(Calculation).where(Calculation.user_id == current_user.id)
+    ).scalars().all()
     return calculations
 
 
@@ -276,24 +307,12 @@ def list_calculations(
 )
 def get_calculation(
     calc_id: str,
-    current_user=Depends(get_current_active_user),
+    current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    try:
-        calc_uuid = UUID(calc_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid calculation id format.")
+    calc_uuid = _parse_calc_id(calc_id)
 
-    calculation = (
-        db.query(Calculation)
-        .filter(
-            Calculation.id == calc_uuid,
-            Calculation.user_id == current_user.id,
-        )
-        .first()
-    )
-    if not calculation:
-        raise HTTPException(status_code=404, detail="Calculation not found.")
+    calculation = _get_user_calc(db, calc_uuid, current_user.id)
 
     return calculation
 
@@ -306,24 +325,12 @@ def get_calculation(
 def update_calculation(
     calc_id: str,
     calculation_update: CalculationUpdate,
-    current_user=Depends(get_current_active_user),
+    current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    try:
-        calc_uuid = UUID(calc_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid calculation id format.")
+    calc_uuid = _parse_calc_id(calc_id)
 
-    calculation = (
-        db.query(Calculation)
-        .filter(
-            Calculation.id == calc_uuid,
-            Calculation.user_id == current_user.id,
-        )
-        .first()
-    )
-    if not calculation:
-        raise HTTPException(status_code=404, detail="Calculation not found.")
+    calculation = _get_user_calc(db, calc_uuid, current_user.id)
 
     if calculation_update.inputs is not None:
         calculation.inputs = calculation_update.inputs
@@ -342,24 +349,12 @@ def update_calculation(
 )
 def delete_calculation(
     calc_id: str,
-    current_user=Depends(get_current_active_user),
+    current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    try:
-        calc_uuid = UUID(calc_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid calculation id format.")
+    calc_uuid = _parse_calc_id(calc_id)
 
-    calculation = (
-        db.query(Calculation)
-        .filter(
-            Calculation.id == calc_uuid,
-            Calculation.user_id == current_user.id,
-        )
-        .first()
-    )
-    if not calculation:
-        raise HTTPException(status_code=404, detail="Calculation not found.")
+    calculation = _get_user_calc(db, calc_uuid, current_user.id)
 
     db.delete(calculation)
     db.commit()
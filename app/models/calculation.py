@@ -14,12 +14,13 @@ from datetime import datetime
 import uuid
 from typing import List
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declared_attr
 
 from app.database import Base
+from app.operations import reduce
 
 
 class AbstractCalculation:
@@ -47,7 +48,6 @@ class AbstractCalculation:
             UUID(as_uuid=True),
             ForeignKey("users.id", ondelete="CASCADE"),
             nullable=False,
-            index=True,
         )
 
     @declared_attr
@@ -112,6 +112,10 @@ class Calculation(Base, AbstractCalculation):
     Base calculation model (polymorphic root).
     """
 
+    # Every calculation lookup filters on (user_id, id); the composite index
+    # also serves user_id-only queries, so user_id carries no index of its own
+    __table_args__ = (Index("ix_calc_user_id", "user_id", "id"),)
+
     __mapper_args__ = {
         "polymorphic_on": "type",
         "polymorphic_identity": "calculation",
@@ -126,7 +130,7 @@ class Addition(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
-        return sum(self.inputs)
+        return reduce("add", self.inputs)
 
 
 class Subtraction(Calculation):
@@ -137,10 +141,7 @@ class Subtraction(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
-            result -= value
-        return result
+        return reduce("subtract", self.inputs)
 
 
 class Multiplication(Calculation):
@@ -151,10 +152,7 @@ class Multiplication(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
-        result = 1
-        for value in self.inputs:
-            result *= value
-        return result
+        return reduce("multiply", self.inputs)
 
 
 class Division(Calculation):
@@ -165,13 +163,8 @@ class Division(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
-            if value == 0:
-                # Match the error message used in the operations tests
-                raise ValueError("Cannot divide by zero!")
-            result /= value
-        return result
+        # Raises "Cannot divide by zero!" to match the operations tests
+        return reduce("divide", self.inputs)
 
 
 class Power(Calculation):
@@ -188,6 +181,4 @@ class Power(Calculation):
             raise ValueError(
                 "Power operation requires exactly two inputs: base and exponent."
             )
-        base = self.inputs[0]
-        exponent = self.inputs[1]
-        return base ** exponent
+        return reduce("power", self.inputs)
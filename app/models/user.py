@@ -70,11 +70,9 @@ class User(Base):
         Authenticate by username OR email.
         Returns User object if authentication succeeds, None otherwise.
         """
-        user = (
-            db.query(cls)
-            .filter((cls.email == identifier) | (cls.username == identifier))
-            .first()
-        )
+        # Usernames can't contain "@", so only one indexed column is queried
+        column = cls.email if "@" in identifier else cls.username
+        user = db.query(cls).filter(column == identifier).first()
 
         if user is None:
             return None
@@ -82,9 +80,9 @@ class User(Base):
         if not user.verify_password(password):
             return None
 
+        # Only last_login changed and we set it ourselves; no refresh needed
         user.last_login = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(user)
 
         return user
 
@@ -100,24 +98,17 @@ class User(Base):
     @classmethod
     def verify_token(cls, token: str):
         """
-        Verify a JWT token and return user data dict if valid, None otherwise.
+        Verify a JWT token and return its payload if valid, None otherwise.
+        The payload is returned as-is with "id" added as the parsed UUID of
+        the "sub" claim, so callers never need to decode the token again.
         """
         from app.auth.jwt import decode_token
         from app.schemas.token import TokenType
         
         try:
             payload = decode_token(token, TokenType.ACCESS)
-            user_id = payload.get("sub")
-            username = payload.get("username")
-            
-            if not user_id:
-                return None
-            
-            # Return dict matching test expectations
-            return {
-                "id": uuid.UUID(user_id),
-                "username": username,
-            }
+            payload["id"] = uuid.UUID(payload["sub"])
+            return payload
         except Exception as e:
             print(f"verify_token error: {e}")  # ADD THIS FOR DEBUGGING
-            return None
\ No newline at end of file
+            return None
@@ -12,12 +12,21 @@ Functions:
 - multiply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]: Returns the product of a and b.
 - divide(a: Union[int, float], b: Union[int, float]) -> float: Returns the quotient when a is divided by b. Raises ValueError if b is zero.
 - power(a: Union[int, float], b: Union[int, float]) -> Union[int, float]: Returns a raised to the power of b.
+- reduce(op: str, inputs: Sequence[Number]) -> float: Folds a list of numbers with one of the operations above.
+  Lists of JIT_THRESHOLD or more numbers run through a Numba-compiled kernel; shorter ones stay in Python,
+  where calling the function directly is cheaper than dispatching to the kernel.
 
 Usage:
 These functions can be imported and used in other modules or integrated into APIs
 to perform arithmetic operations based on user input.
 """
-from typing import Union
+from functools import reduce as _fold
+from typing import Sequence, Union
+
+import numpy as np
+from numba import njit
+
+from app.operations import _kernels
 
 Number = Union[int, float]
 
@@ -44,5 +53,52 @@ class Operations:
     def multiply(self, a, b): return multiply(a, b)
     def divide(self, a, b): return divide(a, b)
     def power(self, a, b): return power(a, b)
+    def reduce_batch(self, op, xs): return reduce(op, xs)
 
 operations = Operations()
+
+
+# Kernels that fold a whole list of inputs in one native loop. A prebuilt
+# ops_native extension (see _native.py) is used when present. Otherwise the
+# kernels are JIT-compiled: the explicit signature makes Numba compile them
+# at import, and cache=True stores the machine code on disk so other workers
+# skip that step.
+try:
+    from app.operations import ops_native as _native
+except ImportError:
+    _native = None
+
+def _load_kernel(name):
+    if _native is not None:
+        return getattr(_native, name)
+    return njit(_kernels.SIGNATURE, cache=True)(getattr(_kernels, name))
+
+_KERNELS = {op: _load_kernel(name) for op, name in _kernels.KERNEL_NAMES.items()}
+
+# Below this many inputs, dispatching to a compiled kernel (plus building
+# the float64 array) costs more than folding the list in Python
+JIT_THRESHOLD = 16
+
+_SCALAR_OPS = {
+    "add": add,
+    "subtract": subtract,
+    "multiply": multiply,
+    "divide": divide,
+    "power": power,
+}
+
+def reduce(op: str, inputs: Sequence[Number]) -> float:
+    """
+    Fold inputs left to right with the named operation
+    ("add", "subtract", "multiply", "divide" or "power").
+    Raises ValueError for an unknown operation or a zero divisor.
+    """
+    kernel = _KERNELS.get(op)
+    if kernel is None:
+        raise ValueError(f"Unsupported operation: {op}")
+    if len(inputs) < JIT_THRESHOLD:
+        return float(_fold(_SCALAR_OPS[op], inputs))
+    values = np.asarray(inputs, dtype=np.float64)
+    if op == "divide" and (values[1:] == 0).any():
+        raise ValueError("Cannot divide by zero!")
+    return float(kernel(values))
@@ -0,0 +1,53 @@
+"""
+Module: _kernels.py
+
+Plain-Python bodies of the array kernels behind app.operations.reduce.
+They are compiled two ways: JIT-compiled with Numba in app/operations/__init__.py,
+and exported ahead of time by app/operations/_native.py.
+
+Each kernel takes a 1-D float64 array and folds it left to right. Neither
+build enables fastmath: letting LLVM reassociate the fold would change
+the result (e.g. of a large sum) depending on how the module was built.
+"""
+
+# Numba type signature shared by every kernel: float64[:] -> float64
+SIGNATURE = "float64(float64[:])"
+
+def add_arr(a):
+    result = 0.0
+    for value in a:
+        result += value
+    return result
+
+def sub_arr(a):
+    result = a[0]
+    for value in a[1:]:
+        result -= value
+    return result
+
+def mul_arr(a):
+    result = 1.0
+    for value in a:
+        result *= value
+    return result
+
+def div_arr(a):
+    result = a[0]
+    for value in a[1:]:
+        result /= value
+    return result
+
+def pow_arr(a):
+    result = a[0]
+    for value in a[1:]:
+        result **= value
+    return result
+
+# Operation name -> kernel name, shared by the JIT and AOT builds
+KERNEL_NAMES = {
+    "add": "add_arr",
+    "subtract": "sub_arr",
+    "multiply": "mul_arr",
+    "divide": "div_arr",
+    "power": "pow_arr",
+}
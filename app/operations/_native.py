@@ -0,0 +1,24 @@
+"""
+Module: _native.py
+
+Ahead-of-time build of the operation kernels with numba.pycc.
+
+Running ``python -m app.operations._native`` writes the ``ops_native``
+extension module next to this file. app.operations imports it when it is
+present, so the first calculation after a deploy doesn't wait for the JIT
+to compile. Without it, app.operations falls back to the JIT kernels.
+"""
+import os
+
+from numba.pycc import CC
+
+from app.operations import _kernels
+
+cc = CC("ops_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+for _name in _kernels.KERNEL_NAMES.values():
+    cc.export(_name, _kernels.SIGNATURE)(getattr(_kernels, _name))
+
+if __name__ == "__main__":
+    cc.compile()
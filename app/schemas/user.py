@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator, model_validator
 
 class UserBase(BaseModel):
     """Base user schema with common fields"""
@@ -30,6 +30,14 @@ class UserBase(BaseModel):
         description="User's unique username"
     )
 
+    @field_validator("username")
+    @classmethod
+    def validate_username(cls, value: str) -> str:
+        """Usernames can't contain "@" so login can tell them apart from emails"""
+        if "@" in value:
+            raise ValueError("Username cannot contain '@'")
+        return value
+
     model_config = ConfigDict(from_attributes=True)
 
 class UserCreate(UserBase):
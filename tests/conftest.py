@@ -1,6 +1,8 @@
+import functools
 import pytest
 from fastapi.testclient import TestClient
-import uuid
+
+from tests.helpers import uniq
 
 @pytest.fixture(scope="session", autouse=True)
 def configure_faker():
@@ -8,29 +10,78 @@ def configure_faker():
     from faker import Faker
     Faker.seed(0)
 
-@pytest.fixture(autouse=True)
-def reset_faker_unique(faker):
-    """Clear Faker unique between each test"""
-    faker.unique.clear()
-
 # ======================================================
-# DATABASE FIXTURE
+# DATABASE FIXTURES
 # ======================================================
-@pytest.fixture(scope="function")
-def db_session():
+@pytest.fixture(scope="session")
+def _schema():
     """
-    Fresh SQLite DB for every test.
+    Create the schema once for the whole run and drop it at the end.
+    Tests are isolated by transaction rollback, never by DDL.
     """
-    from app.database import Base, test_engine, TestingSessionLocal
+    from app.models import Base
+    from app.database import test_engine
 
-    Base.metadata.drop_all(bind=test_engine)
     Base.metadata.create_all(bind=test_engine)
+    yield
+    Base.metadata.drop_all(bind=test_engine)
+
+
+@pytest.fixture(scope="session")
+def db_connection(_schema):
+    """One connection to the test database for the whole run."""
+    from app.database import test_engine
+
+    connection = test_engine.connect()
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def db_session_module(db_connection):
+    """
+    Session for data shared by every test in a module. Its transaction
+    stays open until the module finishes; per-test sessions nest inside
+    it as SAVEPOINTs, so their rollback leaves the shared rows intact.
+    """
+    from app.database import TestingSessionLocal
+
+    transaction = db_connection.begin()
+    db = TestingSessionLocal(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield db
+    finally:
+        db.close()
+        transaction.rollback()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection):
+    """
+    Session for a single test, wrapped in a transaction that is rolled
+    back afterwards. Commits inside the test only release a SAVEPOINT.
+    """
+    from app.database import TestingSessionLocal
 
-    db = TestingSessionLocal()
+    if db_connection.in_transaction():
+        # A module-scoped session owns the outer transaction
+        transaction = db_connection.begin_nested()
+    else:
+        transaction = db_connection.begin()
+    db = TestingSessionLocal(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )
     try:
         yield db
     finally:
         db.close()
+        transaction.rollback()
 
 # ======================================================
 # MANAGED DB SESSION FIXTURE (for test_user.py)
@@ -47,19 +98,61 @@ def managed_db_session(db_session):
         db_session.rollback()
         raise
 
+# ======================================================
+# CHEAP PASSWORD HASHING
+# ======================================================
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    Run the KDFs at their minimum cost for tests. Correctness doesn't
+    depend on the work factor, and production costs dominate test time.
+    """
+    from passlib.context import CryptContext
+
+    test_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated="auto",
+        argon2__time_cost=1,
+        argon2__memory_cost=8,
+        argon2__parallelism=1,
+        bcrypt__rounds=4,
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.auth.hashing.pwd_context", test_context)
+        yield
+
+
+# ======================================================
+# PASSWORD HASH CACHE
+# ======================================================
+@pytest.fixture(scope="session", autouse=True)
+def cached_password_hashes():
+    """
+    Hash each distinct password once per run. Every fake user shares the
+    same password, and re-running the (deliberately slow) KDF for it in
+    each test is pure overhead. Verification is not cached.
+    """
+    from app.auth.hashing import Hashing
+
+    cached_hash = functools.lru_cache(maxsize=None)(Hashing.get_password_hash)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Hashing, "get_password_hash", staticmethod(cached_hash))
+        yield
+
+
 # ======================================================
 # FAKE USER FIXTURE
 # ======================================================
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fake_user_data():
     """Generate unique user data without relying on Faker's unique"""
     def _create():
-        unique_id = uuid.uuid4().hex[:8]
+        n = uniq()
         return {
             "first_name": "Test",
             "last_name": "User",
-            "email": f"test_{unique_id}@example.com",
-            "username": f"user_{unique_id}",
+            "email": f"u{n}@example.com",
+            "username": f"u{n}",
             "password": "TestPass123"
         }
     return _create
@@ -81,8 +174,20 @@ def test_user(db_session, fake_user_data):
 # ======================================================
 # FASTAPI CLIENT OVERRIDE
 # ======================================================
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    One TestClient shared by the whole run. It is deliberately not entered
+    as a context manager, so lifespan events never run: the tests get
+    their schema from db_connection and their session from client.
+    """
+    from app.main import app
+
+    return TestClient(app)
+
+
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(app_client, db_session):
     from app.main import app
     from app.database import get_db
 
@@ -94,8 +199,7 @@ def client(db_session):
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     
     app.dependency_overrides.clear()
 
@@ -104,6 +208,7 @@ def client(db_session):
 # REAL FASTAPI SERVER FOR E2E TESTS
 # ======================================================
 import multiprocessing
+import os
 import time
 import requests
 import uvicorn
@@ -116,6 +221,7 @@ def fastapi_server():
     """
 
     from app.main import app
+    from app.database import USE_TEST_DB
 
     host = "127.0.0.1"
     port = 8005
@@ -123,6 +229,12 @@ def fastapi_server():
 
     # Function to run the server
     def run_server():
+        # The forked server is a real app, not a test: let its lifespan
+        # create the tables instead of deferring to pytest fixtures
+        os.environ.pop("PYTEST_CURRENT_TEST", None)
+        # Fixtures no longer wipe the on-disk test DB, so start from scratch
+        if USE_TEST_DB:
+            os.environ["E2E_TESTS"] = "true"
         uvicorn.run(app, host=host, port=port, log_level="info")
 
     # Start the server in a background process
@@ -71,6 +71,23 @@ def test_user_registration(base_url: str):
     assert data["is_active"] is True
     assert data["is_verified"] is False
 
+def test_duplicate_user_registration(base_url: str):
+    url = f"{base_url}/auth/register"
+    payload = {
+        "first_name": "Dana",
+        "last_name": "Lee",
+        "email": "dana.lee@example.com",
+        "username": "danalee",
+        "password": "SecurePass123!",
+        "confirm_password": "SecurePass123!"
+    }
+    first = requests.post(url, json=payload)
+    assert first.status_code == 201, f"Expected 201 but got {first.status_code}. Response: {first.text}"
+
+    duplicate = requests.post(url, json={**payload, "email": "dana.lee2@example.com"})
+    assert duplicate.status_code == 400, f"Expected 400 but got {duplicate.status_code}. Response: {duplicate.text}"
+    assert duplicate.json()["detail"] == "Email or username already registered"
+
 def test_user_login(base_url: str):
     reg_url = f"{base_url}/auth/register"
     login_url = f"{base_url}/auth/login"
@@ -0,0 +1,10 @@
+# tests/helpers.py
+import itertools
+
+# Monotonic suffix for unique emails/usernames; unlike faker.unique it
+# keeps no history and never has to retry on a collision
+_uid = itertools.count()
+
+def uniq():
+    """Return the next unique integer for test identifiers."""
+    return next(_uid)
@@ -180,3 +180,28 @@ def test_power_requires_two_inputs(client, auth_token):
         headers={"Authorization": f"Bearer {auth_token}"}
     )
     assert response.status_code in (400, 422)
+
+#Calculation id validation
+
+@pytest.mark.parametrize("calc_id", [
+    "not-a-uuid",
+    "1234",
+    "{" + "0" * 32 + "}",
+    "12345678-1234-5678-1234-567812345678%0A",  # trailing newline
+])
+def test_get_calculation_invalid_id(client, auth_token, calc_id):
+    """Malformed calculation ids are rejected with 400"""
+    response = client.get(
+        f"/calculations/{calc_id}",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid calculation id format."
+
+def test_get_calculation_unknown_id(client, auth_token):
+    """A well-formed id that doesn't exist is a 404"""
+    response = client.get(
+        f"/calculations/{uuid.uuid4()}",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert response.status_code == 404
@@ -1,7 +1,8 @@
+import asyncio
 import pytest
 from unittest.mock import patch
 from fastapi import HTTPException, status
-from app.auth.dependencies import get_current_user, get_current_active_user
+from app.auth.dependencies import get_current_user, get_current_user_async
 from app.schemas.user import UserResponse
 from app.models.user import User
 from uuid import uuid4
@@ -82,24 +83,55 @@ def test_get_current_user_valid_token_incomplete_payload(mock_verify_token):
 
     mock_verify_token.assert_called_once_with("validtoken")
 
-# Test get_current_active_user with an active user
-def test_get_current_active_user_active(mock_verify_token):
+# Test get_current_user fills defaults for fields a real token doesn't carry
+def test_get_current_user_minimal_payload_uses_defaults(mock_verify_token):
+    user_id = uuid4()
+    mock_verify_token.return_value = {"id": user_id, "username": "tokenuser"}
+
+    user_response = get_current_user(token="validtoken")
+
+    assert isinstance(user_response, UserResponse)
+    assert user_response.id == user_id
+    assert user_response.username == "tokenuser"
+    assert user_response.email == "test@example.com"
+    assert user_response.is_active is True
+    assert user_response.is_verified is False
+    assert user_response.created_at == user_response.updated_at
+
+# Test get_current_user with an active user
+def test_get_current_user_active(mock_verify_token):
     mock_verify_token.return_value = sample_user_data
 
-    current_user = get_current_user(token="validtoken")
-    active_user = get_current_active_user(current_user=current_user)
+    active_user = get_current_user(token="validtoken")
 
     assert isinstance(active_user, UserResponse)
     assert active_user.is_active is True
 
-# Test get_current_active_user with an inactive user
-def test_get_current_active_user_inactive(mock_verify_token):
+# Test get_current_user rejects an inactive user
+def test_get_current_user_inactive(mock_verify_token):
     mock_verify_token.return_value = inactive_user_data
 
-    current_user = get_current_user(token="validtoken")
-
     with pytest.raises(HTTPException) as exc_info:
-        get_current_active_user(current_user=current_user)
+        get_current_user(token="validtoken")
 
     assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
     assert exc_info.value.detail == "Inactive user"
+
+# Test get_current_user_async resolves the same UserResponse off the event loop
+def test_get_current_user_async_valid_token(mock_verify_token):
+    mock_verify_token.return_value = sample_user_data
+
+    user_response = asyncio.run(get_current_user_async(token="validtoken"))
+
+    assert isinstance(user_response, UserResponse)
+    assert user_response.id == sample_user_data["id"]
+    mock_verify_token.assert_called_once_with("validtoken")
+
+# Test get_current_user_async with invalid token (returns None)
+def test_get_current_user_async_invalid_token(mock_verify_token):
+    mock_verify_token.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_current_user_async(token="invalidtoken"))
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,146 @@
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+from fastapi import HTTPException
+
+import app.auth.jwt as jwt_module
+from app.auth.jwt import create_token, decode_token
+from app.schemas.token import TokenType
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    jwt_module._token_cache.clear()
+    yield
+    jwt_module._token_cache.clear()
+
+
+# ----------------------------------------------------------------------
+# VERIFIED PAYLOAD CACHE
+# ----------------------------------------------------------------------
+def test_decode_token_caches_verified_payload():
+    token = create_token(uuid4(), TokenType.ACCESS, username="cached")
+
+    with patch.object(jwt_module.jwt, "decode", wraps=jwt_module.jwt.decode) as mock_decode:
+        first = decode_token(token, TokenType.ACCESS)
+        second = decode_token(token, TokenType.ACCESS)
+
+    assert first == second
+    assert first["username"] == "cached"
+    assert mock_decode.call_count == 1
+
+
+def test_decode_token_returns_copy_of_cached_payload():
+    token = create_token(uuid4(), TokenType.ACCESS, username="cached")
+
+    payload = decode_token(token, TokenType.ACCESS)
+    payload["username"] = "mutated"
+
+    assert decode_token(token, TokenType.ACCESS)["username"] == "cached"
+
+
+def test_decode_token_does_not_cache_failures():
+    with pytest.raises(HTTPException):
+        decode_token("not-a-token", TokenType.ACCESS)
+
+    assert len(jwt_module._token_cache) == 0
+
+
+def test_decode_token_cache_is_per_token_type():
+    token = create_token(uuid4(), TokenType.ACCESS, username="cached")
+    decode_token(token, TokenType.ACCESS)
+
+    # An access token must still be rejected when a refresh token is expected
+    with pytest.raises(HTTPException):
+        decode_token(token, TokenType.REFRESH)
+
+
+# ----------------------------------------------------------------------
+# VERIFY TOKEN RETURNS FULL PAYLOAD
+# ----------------------------------------------------------------------
+def test_verify_token_returns_full_payload():
+    from app.models.user import User
+
+    user_id = uuid4()
+    token = create_token(user_id, TokenType.ACCESS, username="payload")
+
+    token_data = User.verify_token(token)
+
+    assert token_data["id"] == user_id
+    assert token_data["sub"] == str(user_id)
+    assert token_data["username"] == "payload"
+    assert token_data["type"] == TokenType.ACCESS.value
+    assert "exp" in token_data
+
+
+# ----------------------------------------------------------------------
+# PRE-PARSED SIGNING KEYS
+# ----------------------------------------------------------------------
+def _rsa_private_pem():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+def test_hmac_secret_is_used_as_is():
+    assert jwt_module._load_signing_key("plain-secret") == "plain-secret"
+    assert jwt_module._verify_key("plain-secret") == "plain-secret"
+
+
+def test_rsa_pem_secret_round_trip(monkeypatch):
+    from app.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "ALGORITHM", "RS256")
+    monkeypatch.setattr(get_settings(), "JWT_SECRET_KEY", _rsa_private_pem())
+
+    user_id = uuid4()
+    token = create_token(user_id, TokenType.ACCESS, username="rsa")
+
+    assert decode_token(token, TokenType.ACCESS)["sub"] == str(user_id)
+
+
+def test_pem_secret_is_parsed_once(monkeypatch):
+    from app.core.config import get_settings
+    from cryptography.hazmat.primitives import serialization
+
+    monkeypatch.setattr(get_settings(), "ALGORITHM", "RS256")
+    monkeypatch.setattr(get_settings(), "JWT_SECRET_KEY", _rsa_private_pem())
+
+    with patch.object(
+        serialization, "load_pem_private_key", wraps=serialization.load_pem_private_key
+    ) as mock_load:
+        for _ in range(3):
+            token = create_token(uuid4(), TokenType.ACCESS)
+            decode_token(token, TokenType.ACCESS)
+
+    assert mock_load.call_count == 1
+
+
+# ----------------------------------------------------------------------
+# EPOCH TIMESTAMPS
+# ----------------------------------------------------------------------
+def test_create_token_uses_epoch_timestamps():
+    from datetime import timedelta
+
+    token = create_token(uuid4(), TokenType.ACCESS, expires_delta=timedelta(minutes=5))
+    payload = decode_token(token, TokenType.ACCESS)
+
+    assert isinstance(payload["iat"], int)
+    assert payload["exp"] - payload["iat"] == 300
+
+
+def test_create_token_default_expiry_by_type():
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    access = decode_token(create_token(uuid4(), TokenType.ACCESS), TokenType.ACCESS)
+    refresh = decode_token(create_token(uuid4(), TokenType.REFRESH), TokenType.REFRESH)
+
+    assert access["exp"] - access["iat"] == settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    assert refresh["exp"] - refresh["iat"] == settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
@@ -110,3 +110,18 @@ def test_user_login_invalid_password():
     with pytest.raises(ValidationError):
         UserLogin(**data)
 
+
+def test_user_create_username_with_at_sign():
+    """Test that API usernames can't contain '@' (reserved for email logins)."""
+    from app.schemas.user import UserCreate as ApiUserCreate
+
+    data = {
+        "first_name": "John",
+        "last_name": "Doe",
+        "email": "john.doe@example.com",
+        "username": "john@doe",
+        "password": "SecurePass123!",
+        "confirm_password": "SecurePass123!",
+    }
+    with pytest.raises(ValidationError, match="Username cannot contain '@'"):
+        ApiUserCreate(**data)
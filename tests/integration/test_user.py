@@ -5,15 +5,78 @@
 #          Relies on 'conftest.py' for database session management and test isolation.
 # ======================================================================================
 
+import csv
+import io
 import uuid 
 import pytest
 import logging
-from sqlalchemy import text
-from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+from sqlalchemy import bindparam, func, insert, select, text
+from sqlalchemy.exc import DatabaseError, IntegrityError
 from app.models.user import User
+from tests.helpers import uniq
 
 logger = logging.getLogger(__name__)
 
+# Users created since :t0. Counting only the rows a test added keeps the
+# cost independent of how many users are already in the table; built once
+# at import so SQLAlchemy's compiled-statement cache reuses the SQL
+_COUNT_USERS_SINCE = (
+    select(func.count())
+    .select_from(User)
+    .where(User.created_at >= bindparam("t0"))
+)
+
+# ======================================================================================
+# Bulk Seeding Helpers
+# ======================================================================================
+
+# Above this many rows, seeding on PostgreSQL streams them with COPY
+_COPY_THRESHOLD = 100
+
+_COPY_USERS_SQL = (
+    "COPY users (id, first_name, last_name, email, username, password, "
+    "is_active, is_verified, created_at, updated_at) "
+    "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t')"
+)
+
+
+def _bulk_seed_users(session, rows):
+    """
+    Stream user rows into PostgreSQL with COPY and return their ids.
+    The users table has no server-side defaults, so ids and timestamps
+    are generated here.
+    """
+    now = datetime.utcnow().isoformat()
+    ids = [uuid.uuid4() for _ in rows]
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter="\t")
+    for user_id, row in zip(ids, rows):
+        writer.writerow([
+            user_id, row["first_name"], row["last_name"], row["email"],
+            row["username"], row["password"], row.get("is_active", True),
+            False, now, now,
+        ])
+    buf.seek(0)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(_COPY_USERS_SQL, buf)
+    finally:
+        cursor.close()
+    return ids
+
+
+def _insert_users(session, rows):
+    """Insert user rows (dicts of User columns) and return their ids."""
+    if len(rows) > _COPY_THRESHOLD and session.get_bind().dialect.name == "postgresql":
+        return _bulk_seed_users(session, rows)
+
+    # One multi-row INSERT ... RETURNING: the generated ids come back in the
+    # same round trip instead of a follow-up SELECT per user
+    result = session.execute(insert(User).returning(User.id), rows)
+    return [row.id for row in result]
+
 # ======================================================================================
 # Basic Connection & Session Tests
 # ======================================================================================
@@ -47,8 +110,8 @@ def test_managed_session(managed_db_session):
 # ======================================================================================
 
 def test_session_handling(db_session):
-    """Demonstrate partial commits and rollback behavior."""
-    initial_count = db_session.query(User).count()
+    """Demonstrate savepoint rollback of a failed insert between good ones."""
+    t0 = datetime.utcnow()
 
     # Create user1 (valid)
     user1 = User(
@@ -59,7 +122,6 @@ def test_session_handling(db_session):
         password="hashed_password",
     )
     db_session.add(user1)
-    db_session.commit()
 
     # Create user2 (duplicate email → should fail)
     user2 = User(
@@ -69,12 +131,11 @@ def test_session_handling(db_session):
         username="user2",
         password="hashed_password",
     )
-    db_session.add(user2)
-
-    try:
-        db_session.commit()
-    except Exception:
-        db_session.rollback()
+    # Opening the SAVEPOINT flushes user1 first, so the failed INSERT only
+    # rolls back user2
+    with pytest.raises(IntegrityError):
+        with db_session.begin_nested():
+            db_session.add(user2)
 
     # Create user3 (valid)
     user3 = User(
@@ -85,10 +146,10 @@ def test_session_handling(db_session):
         password="hashed_password",
     )
     db_session.add(user3)
-    db_session.commit()
+    db_session.flush()
 
-    # Verify exactly 2 new users were committed
-    assert db_session.query(User).count() == initial_count + 2
+    # Verify exactly 2 new users were saved
+    assert db_session.execute(_COUNT_USERS_SINCE, {"t0": t0}).scalar_one() == 2
 
 
 # ======================================================================================
@@ -97,45 +158,71 @@ def test_session_handling(db_session):
 
 def test_create_user_with_faker(db_session, faker):
     """Create a user using Faker and confirm it was saved."""
+    n = uniq()
     user_data = {
         "first_name": faker.first_name(),
         "last_name": faker.last_name(),
-        "email": faker.unique.email(),
-        "username": faker.unique.user_name(),
+        "email": f"u{n}@example.com",
+        "username": f"u{n}",
         "password": "hashed_password",
     }
 
     user = User(**user_data)
 
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    db_session.flush()
 
     assert user.id is not None
     assert user.email == user_data["email"]
 
 def test_create_multiple_users(db_session):
     """Create multiple users using unique IDs and verify insertion."""
-    users = []
+    rows = []
     for i in range(3):
-        unique_id = uuid.uuid4().hex[:8]
-        data = {
+        unique_id = f"{uniq():08x}"
+        rows.append({
             "first_name": f"Test{i}",
             "last_name": f"User{i}",
             "email": f"test{unique_id}@example.com",
             "username": f"user{unique_id}",
             "password": "hashed_password",
-        }
-        user = User(**data)
-        users.append(user)
-        db_session.add(user)
-    
-    db_session.commit()
-    
-    for user in users:
-        db_session.refresh(user)
-        assert user.id is not None
+        })
+
+    ids = _insert_users(db_session, rows)
 
+    assert len(ids) == 3
+    assert all(user_id is not None for user_id in ids)
+
+
+def test_bulk_seed_users_with_copy(db_session):
+    """Seed more than _COPY_THRESHOLD users through COPY and read them back."""
+    if db_session.get_bind().dialect.name != "postgresql":
+        pytest.skip("COPY seeding is PostgreSQL-only")
+
+    rows = []
+    for i in range(_COPY_THRESHOLD + 1):
+        unique_id = f"{uniq():08x}"
+        rows.append({
+            "first_name": f"Test{i}",
+            "last_name": f"User{i}",
+            "email": f"test{unique_id}@example.com",
+            "username": f"user{unique_id}",
+            "password": "hashed_password",
+        })
+
+    ids = _insert_users(db_session, rows)
+
+    users = db_session.execute(select(User).where(User.id.in_(ids))).scalars().all()
+    assert len(users) == len(rows)
+
+    by_email = {user.email: user for user in users}
+    for row in rows:
+        user = by_email[row["email"]]
+        assert user.username == row["username"]
+        assert user.first_name == row["first_name"]
+        assert user.is_active is True
+        assert user.is_verified is False
+        assert isinstance(user.created_at, datetime)
 
 # ======================================================================================
 # Query Tests
@@ -143,22 +230,21 @@ def test_create_multiple_users(db_session):
 
 @pytest.fixture
 def seed_users(db_session):
-    """Seed 3 users for query tests."""
-    created = []
+    """Seed 3 users for query tests and return their ids."""
+    rows = []
     for i in range(3):
-        unique_id = uuid.uuid4().hex[:8]
-        u = User(
-            first_name=f"Test{i}",
-            last_name=f"User{i}",
-            email=f"test{unique_id}@example.com",
-            username=f"user{unique_id}",
-            password="hashed_password",
-        )
-        db_session.add(u)
-        created.append(u)
-    
+        unique_id = f"{uniq():08x}"
+        rows.append({
+            "first_name": f"Test{i}",
+            "last_name": f"User{i}",
+            "email": f"test{unique_id}@example.com",
+            "username": f"user{unique_id}",
+            "password": "hashed_password",
+        })
+
+    ids = _insert_users(db_session, rows)
     db_session.commit()
-    return created
+    return ids
 
 # ======================================================================================
 # Transaction Tests
@@ -166,26 +252,25 @@ def seed_users(db_session):
 
 def test_transaction_rollback(db_session, faker):
     """Verify that rollback works properly after an error."""
-    initial_count = db_session.query(User).count()
+    t0 = datetime.utcnow()
 
     # Add a user but force failure before commit
+    n = uniq()
     user_data = {
         "first_name": faker.first_name(),
         "last_name": faker.last_name(),
-        "email": faker.unique.email(),
-        "username": faker.unique.user_name(),
+        "email": f"u{n}@example.com",
+        "username": f"u{n}",
         "password": "hashed_password",
     }
     user = User(**user_data)
-    db_session.add(user)
 
-    try:
-        db_session.execute(text("SELECT * FROM nonexistent_table"))
-        db_session.commit()
-    except Exception:
-        db_session.rollback()
+    with pytest.raises(DatabaseError):
+        with db_session.begin_nested():
+            db_session.add(user)
+            db_session.execute(text("SELECT * FROM nonexistent_table"))
 
-    assert db_session.query(User).count() == initial_count
+    assert db_session.execute(_COUNT_USERS_SINCE, {"t0": t0}).scalar_one() == 0
 
 
 # ======================================================================================
@@ -195,7 +280,7 @@ def test_transaction_rollback(db_session, faker):
 @pytest.fixture
 def local_test_user(db_session):
     """Create a test user for update and other operations."""
-    unique_id = uuid.uuid4().hex[:8]
+    unique_id = f"{uniq():08x}"
     u = User(
         first_name="Test",
         last_name="User",
@@ -204,8 +289,7 @@ def local_test_user(db_session):
         password="hashed_password",
     )
     db_session.add(u)
-    db_session.commit()
-    db_session.refresh(u)
+    db_session.flush()
     return u
 
 
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy.exc import IntegrityError
 from app.models.user import User
 from app.auth.jwt import create_token, TokenType
 
@@ -11,13 +12,31 @@ def make_data(fake_user_data):
     return fake_user_data()
 
 
+@pytest.fixture(scope="module")
+def registered_user(db_session_module, fake_user_data):
+    """One registered user shared by the login and token tests."""
+    data = make_data(fake_user_data)
+    return User.register(db_session_module, data), data
+
+
 # ----------------------------------------------------------------------
 # PASSWORD HASHING
 # ----------------------------------------------------------------------
-def test_password_hashing(db_session, fake_user_data):
-    data = make_data(fake_user_data)
-    user = User.register(db_session, data)
-    assert user.password != data["password"]  # must be hashed
+def test_password_hashing_uses_argon2():
+    from app.auth.hashing import Hashing
+
+    hashed = Hashing.get_password_hash("TestPass123")
+    assert hashed.startswith("$argon2id$")
+    assert Hashing.verify_password("TestPass123", hashed)
+
+
+def test_legacy_bcrypt_hash_still_verifies():
+    from passlib.hash import bcrypt
+    from app.auth.hashing import Hashing
+
+    legacy = bcrypt.using(rounds=4).hash("TestPass123")
+    assert Hashing.verify_password("TestPass123", legacy)
+    assert not Hashing.verify_password("WrongPass123", legacy)
 
 
 # ----------------------------------------------------------------------
@@ -37,60 +56,59 @@ def test_user_registration(db_session, fake_user_data):
 # ----------------------------------------------------------------------
 def test_duplicate_user_registration(db_session, fake_user_data):
     data1 = make_data(fake_user_data)
-    User.register(db_session, data1)
+    user1 = User.register(db_session, data1)
 
-    data2 = make_data(fake_user_data)
-    data2["email"] = data1["email"]  # duplicate
-    data2["username"] = data1["username"]  # duplicate
+    # Reuse user1's hash: the duplicate is meant to fail at the INSERT, so
+    # there's no point hashing a password for it
+    duplicate = User(
+        first_name="Dup",
+        last_name="User",
+        email=data1["email"],  # duplicate
+        username=data1["username"],  # duplicate
+        password=user1.password,
+    )
 
-    with pytest.raises(Exception):
-        User.register(db_session, data2)
+    with pytest.raises(IntegrityError):
+        db_session.add(duplicate)
+        db_session.flush()
 
 
 # ----------------------------------------------------------------------
-# LOGIN / AUTH
+# CHECKS AGAINST THE SHARED REGISTERED USER
 # ----------------------------------------------------------------------
-def test_user_authentication(db_session, fake_user_data):
-    data = make_data(fake_user_data)
-    user = User.register(db_session, data)
+def check_hashing(db_session, user, data):
+    assert user.password != data["password"]  # must be hashed
+
 
+def check_email_auth(db_session, user, data):
     authenticated = User.authenticate(db_session, data["email"], data["password"])
     assert authenticated.id == user.id
 
 
-# ----------------------------------------------------------------------
-# LAST LOGIN UPDATE
-# ----------------------------------------------------------------------
-def test_user_last_login_update(db_session, fake_user_data):
-    data = make_data(fake_user_data)
-    user = User.register(db_session, data)
+def check_username_auth(db_session, user, data):
+    authenticated = User.authenticate(db_session, data["username"], data["password"])
+    assert authenticated.id == user.id
+
 
+def check_last_login(db_session, user, data):
     old_last_login = user.last_login
 
     authenticated = User.authenticate(db_session, data["email"], data["password"])
-    db_session.refresh(authenticated)
 
     assert authenticated.last_login != old_last_login
 
 
-# ----------------------------------------------------------------------
-# TOKEN CREATION + VALIDATION
-# ----------------------------------------------------------------------
-def test_token_creation_and_verification(db_session, fake_user_data):
-    data = make_data(fake_user_data)
-    user = User.register(db_session, data)
-
+def check_token(db_session, user, data):
     token = create_token({"sub": str(user.id)}, TokenType.ACCESS)
     assert isinstance(token, str)
     assert len(token) > 10
 
 
-# ----------------------------------------------------------------------
-# AUTH WITH EMAIL INSTEAD OF USERNAME
-# ----------------------------------------------------------------------
-def test_authenticate_with_email(db_session, fake_user_data):
-    data = make_data(fake_user_data)
-    user = User.register(db_session, data)
-
-    authenticated = User.authenticate(db_session, data["email"], data["password"])
-    assert authenticated.id == user.id
+@pytest.mark.parametrize(
+    "check",
+    [check_hashing, check_email_auth, check_username_auth, check_last_login, check_token],
+    ids=lambda check: check.__name__.removeprefix("check_"),
+)
+def test_registered_user(db_session, registered_user, check):
+    user, data = registered_user
+    check(db_session, user, data)
@@ -1,9 +1,12 @@
 # tests/unit/test_calculator.py
 
+import functools  # Import functools for the reference left fold
+import operator  # Import operator for the reference binary operations
+import random  # Import random for reproducible non-trivial float inputs
 import pytest  # Import the pytest framework for writing and running tests
 from typing import Union  # Import Union for type hinting multiple possible types
 from app.operations import add, subtract, multiply, divide  # Import the calculator functions from the operations module
-from app.operations import operations
+from app.operations import operations, reduce, JIT_THRESHOLD
 
 # Define a type alias for numbers that can be either int or float
 Number = Union[int, float]
@@ -251,3 +254,94 @@ def test_power_zero_exponent():
     assert result == 1
 
 
+# ---------------------------------------------
+# Unit Tests for the compiled 'reduce' Function
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "op, inputs, expected",
+    [
+        ("add", [10, 5, 3.5], 18.5),       # Test folding a list with addition
+        ("subtract", [20, 5, 3], 12.0),    # Test folding a list with subtraction
+        ("multiply", [2, 3, 4], 24.0),     # Test folding a list with multiplication
+        ("divide", [100, 2, 5], 10.0),     # Test folding a list with division
+        ("power", [2, 3], 8.0),            # Test raising a base to an exponent
+    ],
+    ids=[
+        "reduce_add",
+        "reduce_subtract",
+        "reduce_multiply",
+        "reduce_divide",
+        "reduce_power",
+    ]
+)
+def test_reduce(op: str, inputs: list, expected: float) -> None:
+    """Test that 'reduce' folds the inputs with the named operation."""
+    result = reduce(op, inputs)
+    assert result == expected, f"Expected reduce({op}, {inputs}) to be {expected}, but got {result}"
+
+
+def test_reduce_divide_by_zero() -> None:
+    """Test that 'reduce' rejects a zero divisor anywhere after the first input."""
+    with pytest.raises(ValueError, match="Cannot divide by zero!"):
+        reduce("divide", [10, 2, 0])
+
+
+def test_reduce_unknown_operation() -> None:
+    """Test that 'reduce' rejects an unknown operation name."""
+    with pytest.raises(ValueError, match="Unsupported operation"):
+        reduce("modulo", [10, 3])
+
+
+@pytest.mark.parametrize(
+    "op, expected",
+    [
+        ("add", 20.0),        # Test summing twenty 1.0s
+        ("subtract", -18.0),  # Test 1.0 minus nineteen 1.0s
+        ("multiply", 1.0),    # Test multiplying twenty 1.0s
+        ("divide", 1.0),      # Test dividing 1.0 by nineteen 1.0s
+    ],
+    ids=[
+        "reduce_batch_add",
+        "reduce_batch_subtract",
+        "reduce_batch_multiply",
+        "reduce_batch_divide",
+    ]
+)
+def test_reduce_batch(op: str, expected: float) -> None:
+    """Test that batches of JIT_THRESHOLD or more inputs fold correctly in the compiled kernel."""
+    inputs = [1.0] * 20
+    assert len(inputs) >= JIT_THRESHOLD
+    assert operations.reduce_batch(op, inputs) == expected
+
+
+def test_reduce_batch_divide_by_zero() -> None:
+    """Test that the compiled path also rejects a zero divisor."""
+    inputs = [1.0] * JIT_THRESHOLD + [0.0]
+    with pytest.raises(ValueError, match="Cannot divide by zero!"):
+        operations.reduce_batch("divide", inputs)
+
+
+_REFERENCE_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+    "power": operator.pow,
+}
+
+
+@pytest.mark.parametrize("length", [JIT_THRESHOLD - 1, JIT_THRESHOLD, 3 * JIT_THRESHOLD])
+@pytest.mark.parametrize("op", list(_REFERENCE_OPS))
+def test_reduce_matches_left_fold(op: str, length: int) -> None:
+    """Test that both sides of JIT_THRESHOLD give exactly the left-to-right fold."""
+    rng = random.Random(f"{op}-{length}")
+    # Values near 1 keep long products and power towers finite
+    inputs = [rng.uniform(0.5, 1.5) for _ in range(length)]
+    assert reduce(op, inputs) == functools.reduce(_REFERENCE_OPS[op], inputs)
+
+
+def test_reduce_add_is_not_reassociated() -> None:
+    """Test that the compiled sum keeps the fold order instead of reassociating it."""
+    inputs = [1e16] + [1.0] * (2 * JIT_THRESHOLD) + [-1e16]
+    assert reduce("add", inputs) == functools.reduce(operator.add, inputs) == 0.0